@@ -16,6 +16,8 @@ Features:
 - Centralized management of API keys, secrets, and configuration
 - Flexible support for Binance Testnet and Mainnet
 - Efficient session management with proxy support
+- Lazy construction: proxies are probed and modules are built only when first used
+- Optional warm-up at startup: warm() opens connections and loads Futures metadata up front
 
 Usage Example:
 --------------
@@ -28,8 +30,21 @@ client = BinanceCoreClient(
     proxy_list=[],
     testnet=True
 )
+
+# Optionally pay for proxy selection, TLS handshakes and metadata loading before trading starts
+client.warm()
+
+# Run independent calls at the same time over the shared connection pool
+from functools import partial
+cancel_result, balance = client.run_concurrently(
+    partial(client.spot_trading.cancel_all_spot_orders, "BTCUSDT"),
+    client.futures_trading.check_futures_balance
+)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+
 from proxy_manager import ProxyManager
 from spot_trading import SpotTrading
 from margin_trading import MarginTrading
@@ -37,9 +52,12 @@ from futures_trading import FuturesTrading
 from public_data_manager import PublicDataManager
 from utils import Utils
 
+# Upper bound on API calls run at the same time by run_concurrently()
+MAX_CONCURRENT_CALLS = 16
+
 
 class BinanceCoreClient:
-    def __init__(self, api_key, api_secret, proxy_list, testnet=False):
+    def __init__(self, api_key, api_secret, proxy_list, testnet=False, force_proxy=False):
         """
         Initialize the Binance Core Client with API key, API secret, proxies, and testnet configuration.
 
@@ -47,29 +65,83 @@ class BinanceCoreClient:
         :param api_secret: Your Binance API secret
         :param proxy_list: List of proxy dicts (with address, port, username, password)
         :param testnet:    True => Use Binance Testnet for testing purposes
+        :param force_proxy: True => Always route trading traffic through a proxy, even if Binance is reachable directly
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
+        self.force_proxy = force_proxy
 
         # Define Base URLs
         self.base_url_futures = "https://testnet.binancefuture.com" if testnet else "https://fapi.binance.com"
         self.base_url_spot = "https://testnet.binance.vision" if testnet else "https://api.binance.com"
 
-        # Initialize proxy manager and session
+        # Proxies are only probed once the session is first needed
         self.proxy_manager = ProxyManager(proxy_list)
-        self.session = self.proxy_manager.initialize_session()
 
-        # Initialize trading modules
-        self.spot_trading = SpotTrading(api_key, api_secret, self.session, self.base_url_spot)
-        self.margin_trading = MarginTrading(api_key, api_secret, self.session, self.base_url_spot)
-        self.futures_trading = FuturesTrading(api_key, api_secret, self.session, self.base_url_futures)
+    # ------------------------------------------------------------------------
+    # Lazily constructed session and sub-modules
+    # ------------------------------------------------------------------------
 
-        # Initialize public data manager
-        self.public_data = PublicDataManager()
+    @cached_property
+    def session(self):
+        """
+        The shared trading session, initialized through the proxy manager on first access.
+        """
+        return self.proxy_manager.initialize_session(force_proxy=self.force_proxy)
 
-        # Utilities
-        self.utils = Utils()
+    @cached_property
+    def spot_trading(self):
+        return SpotTrading(self.api_key, self.api_secret, self.session, self.base_url_spot)
+
+    @cached_property
+    def margin_trading(self):
+        return MarginTrading(self.api_key, self.api_secret, self.session, self.base_url_spot)
+
+    @cached_property
+    def futures_trading(self):
+        return FuturesTrading(self.api_key, self.api_secret, self.session, self.base_url_futures)
+
+    @cached_property
+    def public_data(self):
+        return PublicDataManager()
+
+    @cached_property
+    def utils(self):
+        return Utils()
+
+    def warm(self):
+        """
+        Initializes the session and prepares it for trading, so the first real calls don't pay
+        for proxy selection, TLS handshakes or Futures metadata. Call it once at startup;
+        it blocks until the warm-up requests have finished.
+
+        :return: True if a session is available, False otherwise
+        """
+        session = self.session
+        if not session:
+            return False
+
+        self.run_concurrently(
+            partial(self._warm_connection, session, f"{self.base_url_spot}/api/v3/ping"),
+            partial(self._warm_connection, session, f"{self.base_url_futures}/fapi/v1/ping"),
+            self.futures_trading.prewarm
+        )
+        return True
+
+    @staticmethod
+    def _warm_connection(session, url):
+        """
+        Sends a lightweight request so the session's connection pool for that host is ready.
+
+        :param session: The session to warm up
+        :param url:     A ping endpoint on the host to warm up
+        """
+        try:
+            session.get(url, timeout=5)
+        except Exception:
+            # Warming is best effort; the real request will open its own connection
+            pass
 
     def get_base_urls(self):
         """
@@ -81,3 +153,17 @@ class BinanceCoreClient:
             "spot_base_url": self.base_url_spot,
             "futures_base_url": self.base_url_futures
         }
+
+    def run_concurrently(self, *calls):
+        """
+        Runs several API calls at the same time, sharing the session's keep-alive connection pool.
+
+        :param calls: Zero-argument callables (e.g. functools.partial objects wrapping module methods)
+        :return: List of results in the same order as `calls`
+        """
+        if not calls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_CALLS, len(calls))) as executor:
+            futures = [executor.submit(call) for call in calls]
+            return [future.result() for future in futures]
@@ -2,16 +2,41 @@
 Futures Trading Module
 ---------------------
 This module provides functions for Binance Futures trading, including:
-- Placing futures orders
+- Placing futures orders (single and batched)
 - Setting leverage for positions
 - Fetching account and position details
 - Managing margin type
 - Fetching all open positions
 """
 
+import json
 import logging
+import threading
+import time
 from utils import Utils
 
+# Maximum number of orders accepted by a single /fapi/v1/batchOrders request
+MAX_BATCH_ORDERS = 5
+
+# Seconds a fetched exchange info payload is reused before being refreshed
+EXCHANGE_INFO_TTL = 3600
+
+# Seconds the leverage bracket index is reused before being refreshed, and the minimum
+# age before a lookup of an unknown symbol (e.g. a new listing) may reload it
+LEVERAGE_BRACKETS_TTL = 3600
+LEVERAGE_BRACKETS_MISS_TTL = 60
+
+
+def _format_order(order: dict) -> dict:
+    """
+    Converts order values to the strings Binance expects, dropping unset (None) fields.
+    Booleans are sent as 'true'/'false' (e.g. reduceOnly).
+    """
+    return {
+        key: ('true' if value else 'false') if isinstance(value, bool) else str(value)
+        for key, value in order.items() if value is not None
+    }
+
 
 class FuturesTrading:
     def __init__(self, api_key, api_secret, session, base_url_futures):
@@ -27,8 +52,27 @@ class FuturesTrading:
         self.api_secret = api_secret
         self.session = session
         self.base_url_futures = base_url_futures
+        self._headers = Utils.generate_headers(api_key)
         self.logger = logging.getLogger(__name__)
 
+        # Cached exchange metadata
+        self._exch_info = None
+        self._exch_info_ts = 0
+        self._lev_brackets = {}
+        self._lev_brackets_ts = 0
+        self._lev_brackets_lock = threading.Lock()
+
+        # Last leverage successfully set per symbol
+        self._lev_cache = {}
+
+    def prewarm(self):
+        """
+        Loads exchange info and leverage brackets up front, so the first order and
+        metadata lookups don't pay for these requests.
+        """
+        self.get_futures_exchange_info()
+        self._load_leverage_brackets()
+
     # ------------------------------------------------------------------------
     # Account and Position Methods
     # ------------------------------------------------------------------------
@@ -36,12 +80,18 @@ class FuturesTrading:
     def get_futures_exchange_info(self) -> dict:
         """
         Fetches exchange info (symbols, trading rules) for the Futures market.
+        The result is cached for EXCHANGE_INFO_TTL seconds.
         """
+        if self._exch_info is not None and time.monotonic() - self._exch_info_ts < EXCHANGE_INFO_TTL:
+            return self._exch_info
+
         try:
             url = f"{self.base_url_futures}/fapi/v1/exchangeInfo"
             response = self.session.get(url)
             response.raise_for_status()
-            return response.json()
+            self._exch_info = response.json()
+            self._exch_info_ts = time.monotonic()
+            return self._exch_info
         except Exception as e:
             self.logger.error(f"Error fetching Futures exchange info: {e}")
             return None
@@ -55,9 +105,8 @@ class FuturesTrading:
             timestamp = Utils.get_current_timestamp_ms()
             params = {'timestamp': timestamp}
             params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = Utils.generate_headers(self.api_key)
 
-            response = self.session.get(url, params=params, headers=headers)
+            response = self.session.get(url, params=params, headers=self._headers)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -73,9 +122,8 @@ class FuturesTrading:
             timestamp = Utils.get_current_timestamp_ms()
             params = {'symbol': symbol, 'timestamp': timestamp}
             params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = Utils.generate_headers(self.api_key)
 
-            response = self.session.get(url, params=params, headers=headers)
+            response = self.session.get(url, params=params, headers=self._headers)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -91,9 +139,8 @@ class FuturesTrading:
             timestamp = Utils.get_current_timestamp_ms()
             params = {'timestamp': timestamp}
             params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = Utils.generate_headers(self.api_key)
 
-            response = self.session.get(url, params=params, headers=headers)
+            response = self.session.get(url, params=params, headers=self._headers)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -109,40 +156,91 @@ class FuturesTrading:
                              take_profit: float = None) -> dict:
         """
         Creates a Futures order. Optionally sets leverage, stop loss, or take profit.
+        Leverage is only sent when it differs from the last value set for the symbol.
         """
-        if leverage:
+        if leverage and self._lev_cache.get(symbol) != leverage:
             self.set_leverage(symbol, leverage)
 
-        try:
-            url = f"{self.base_url_futures}/fapi/v1/order"
-            timestamp = Utils.get_current_timestamp_ms()
-            params = {
-                'symbol': symbol,
-                'side': side,
-                'type': order_type,
-                'quantity': quantity,
-                'timestamp': timestamp
-            }
-
-            if order_type == 'LIMIT':
-                params.update({'price': price, 'timeInForce': 'GTC'})
+        order = {
+            'symbol': symbol,
+            'side': side,
+            'type': order_type,
+            'quantity': quantity
+        }
 
-            if stop_loss:
-                params.update({'stopPrice': stop_loss, 'type': 'STOP_LOSS_LIMIT', 'timeInForce': 'GTC'})
+        if order_type == 'LIMIT':
+            order.update({'price': price, 'timeInForce': 'GTC'})
 
-            if take_profit:
-                params.update({'stopPrice': take_profit, 'type': 'TAKE_PROFIT_LIMIT', 'timeInForce': 'GTC'})
+        if stop_loss:
+            order.update({'stopPrice': stop_loss, 'type': 'STOP_LOSS_LIMIT', 'timeInForce': 'GTC'})
 
-            params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = Utils.generate_headers(self.api_key)
+        if take_profit:
+            order.update({'stopPrice': take_profit, 'type': 'TAKE_PROFIT_LIMIT', 'timeInForce': 'GTC'})
 
-            response = self.session.post(url, params=params, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        try:
+            return self._send_order(order)
         except Exception as e:
             self.logger.error(f"Error creating Futures order: {e}")
             return None
 
+    def create_futures_orders_batch(self, orders: list) -> list:
+        """
+        Places multiple Futures orders through the batchOrders endpoint.
+
+        Orders are sent in groups of up to 5 (the Binance limit), each group as a single signed request.
+        A single order is sent through /fapi/v1/order instead, which costs less request weight.
+
+        :param orders: List of order dicts (symbol, side, type, quantity, price, ...)
+        :return: One response entry per order: the order, or an error object with 'code' and 'msg'.
+                 Orders of a group whose request failed get {'code': None, 'msg': ...} entries;
+                 their status on the exchange is unknown.
+        """
+        if len(orders) == 1:
+            try:
+                return [self._send_order(orders[0])]
+            except Exception as e:
+                self.logger.error(f"Error creating Futures order: {e}")
+                return [{'code': None, 'msg': str(e)}]
+
+        url = f"{self.base_url_futures}/fapi/v1/batchOrders"
+        results = []
+
+        for i in range(0, len(orders), MAX_BATCH_ORDERS):
+            batch = [_format_order(order) for order in orders[i:i + MAX_BATCH_ORDERS]]
+            try:
+                timestamp = Utils.get_current_timestamp_ms()
+                params = {
+                    'batchOrders': json.dumps(batch, separators=(',', ':')),
+                    'timestamp': timestamp
+                }
+                params['signature'] = Utils.generate_signature(params, self.api_secret)
+
+                response = self.session.post(url, params=params, headers=self._headers)
+                response.raise_for_status()
+                results.extend(response.json())
+            except Exception as e:
+                # Keep going: orders of earlier groups are already live and must still be reported
+                self.logger.error(f"Error creating Futures batch orders: {e}")
+                results.extend({'code': None, 'msg': str(e)} for _ in batch)
+
+        return results
+
+    def _send_order(self, order: dict) -> dict:
+        """
+        Places one Futures order through /fapi/v1/order.
+
+        :param order: Order dict (symbol, side, type, quantity, price, ...)
+        :return: The order response; raises on request errors
+        """
+        url = f"{self.base_url_futures}/fapi/v1/order"
+        params = _format_order(order)
+        params['timestamp'] = Utils.get_current_timestamp_ms()
+        params['signature'] = Utils.generate_signature(params, self.api_secret)
+
+        response = self.session.post(url, params=params, headers=self._headers)
+        response.raise_for_status()
+        return response.json()
+
     def close_futures_position_with_reduce_only(self, symbol: str, side: str, quantity: float) -> dict:
         """
         Closes a Futures position using reduceOnly = true.
@@ -159,9 +257,8 @@ class FuturesTrading:
                 'timestamp': timestamp
             }
             params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = Utils.generate_headers(self.api_key)
 
-            response = self.session.post(url, params=params, headers=headers)
+            response = self.session.post(url, params=params, headers=self._headers)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -185,10 +282,10 @@ class FuturesTrading:
                 'timestamp': timestamp
             }
             params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = Utils.generate_headers(self.api_key)
 
-            response = self.session.post(url, params=params, headers=headers)
+            response = self.session.post(url, params=params, headers=self._headers)
             response.raise_for_status()
+            self._lev_cache[symbol] = leverage
             return response.json()
         except Exception as e:
             self.logger.error(f"Error setting leverage: {e}")
@@ -207,9 +304,8 @@ class FuturesTrading:
                 'timestamp': timestamp
             }
             params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = Utils.generate_headers(self.api_key)
 
-            response = self.session.post(url, params=params, headers=headers)
+            response = self.session.post(url, params=params, headers=self._headers)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -219,22 +315,38 @@ class FuturesTrading:
     def get_max_futures_leverage(self, symbol: str) -> int:
         """
         Fetches the maximum possible leverage level for a given Futures symbol.
+        The brackets of all symbols are loaded with the first lookup and served from memory
+        for LEVERAGE_BRACKETS_TTL seconds. An unknown symbol triggers at most one reload.
         """
-        try:
-            url = f"{self.base_url_futures}/fapi/v1/leverageBracket"
-            timestamp = Utils.get_current_timestamp_ms()
-            params = {'symbol': symbol, 'timestamp': timestamp}
-            params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = Utils.generate_headers(self.api_key)
+        if not self._load_leverage_brackets() and symbol not in self._lev_brackets:
+            self._load_leverage_brackets(max_age=LEVERAGE_BRACKETS_MISS_TTL)
+        return self._lev_brackets.get(symbol)
 
-            response = self.session.get(url, params=params, headers=headers)
-            response.raise_for_status()
+    def _load_leverage_brackets(self, max_age=LEVERAGE_BRACKETS_TTL):
+        """
+        Fetches the leverage brackets of all symbols in one request and indexes
+        the initial (maximum) leverage by symbol.
 
-            leverage_data = response.json()
-            for bracket in leverage_data:
-                if bracket['symbol'] == symbol:
-                    return bracket['brackets'][0]['initialLeverage']
-            return None
-        except Exception as e:
-            self.logger.error(f"Error fetching max leverage for {symbol}: {e}")
-            return None
+        Does nothing if the index was loaded less than `max_age` seconds ago. Loads are
+        serialized, so a lookup during prewarm() waits for it instead of fetching again.
+
+        :return: True if a request was made, False if the cached index was kept.
+        """
+        with self._lev_brackets_lock:
+            if self._lev_brackets_ts and time.monotonic() - self._lev_brackets_ts < max_age:
+                return False
+            try:
+                url = f"{self.base_url_futures}/fapi/v1/leverageBracket"
+                timestamp = Utils.get_current_timestamp_ms()
+                params = {'timestamp': timestamp}
+                params['signature'] = Utils.generate_signature(params, self.api_secret)
+
+                response = self.session.get(url, params=params, headers=self._headers)
+                response.raise_for_status()
+
+                leverage_data = response.json()
+                self._lev_brackets = {b['symbol']: b['brackets'][0]['initialLeverage'] for b in leverage_data}
+                self._lev_brackets_ts = time.monotonic()
+            except Exception as e:
+                self.logger.error(f"Error fetching leverage brackets: {e}")
+            return True
@@ -28,6 +28,7 @@ class MarginTrading:
         self.api_secret = api_secret
         self.session = session
         self.base_url_spot = base_url_spot
+        self._headers = Utils.generate_headers(api_key)
         self.logger = logging.getLogger(__name__)
 
     def fetch_margin_balance(self, is_isolated: bool = True, symbol: str = None) -> dict:
@@ -54,9 +55,8 @@ class MarginTrading:
                 params['symbols'] = symbol
 
             params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = {'X-MBX-APIKEY': self.api_key}
 
-            response = self.session.get(url, headers=headers, params=params)
+            response = self.session.get(url, headers=self._headers, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -98,9 +98,8 @@ class MarginTrading:
                 params['price'] = price
 
             params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = {'X-MBX-APIKEY': self.api_key}
 
-            response = self.session.post(url, headers=headers, params=params)
+            response = self.session.post(url, headers=self._headers, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -133,9 +132,8 @@ class MarginTrading:
             }
 
             params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = {'X-MBX-APIKEY': self.api_key}
 
-            response = self.session.post(url, headers=headers, params=params)
+            response = self.session.post(url, headers=self._headers, params=params)
             response.raise_for_status()
             return response.json()
         except Exception as e:
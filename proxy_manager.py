@@ -1,7 +1,22 @@
-import socks
-import socket
 import requests
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Endpoint used to check that a proxy can actually reach the Binance API over HTTPS
+PROXY_TEST_URL = "https://api.binance.com/api/v3/ping"
+PROXY_TEST_TIMEOUT = 3
+
+SUPPORTED_PROXY_TYPES = ('socks5', 'socks5h', 'http', 'https')
+
+# Connection pool size per host for proxied sessions shared by the trading modules
+PROXY_POOL_MAXSIZE = 32
+
+# A direct connection answering the test endpoint within this many seconds is used instead of a proxy
+DIRECT_MAX_LATENCY = 0.15
+
 
 class ProxyManager:
     def __init__(self, proxy_list):
@@ -13,7 +28,6 @@ class ProxyManager:
                            'type' can be 'socks5', 'http', or 'https'.
         """
         self.proxy_list = proxy_list
-        self.proxy_index = 0
         self.session = None
 
         # Configure logging
@@ -22,53 +36,51 @@ class ProxyManager:
 
     def _test_proxy(self, proxy_info):
         """
-        Tests if a proxy is working by connecting to a known host.
+        Tests if a proxy is working by sending a GET request to the Binance API through it.
 
         :param proxy_info: Dictionary with proxy details.
-        :return: True if the proxy works, False otherwise.
+        :return: True if the proxy works, False otherwise (including malformed entries).
         """
         try:
-            if proxy_info['type'].lower() in ['socks5', 'http', 'https']:
-                sock = socks.socksocket()
-
-                # Set proxy type
-                proxy_type = {
-                    'socks5': socks.SOCKS5
-                }.get(proxy_info['type'].lower(), socks.HTTP)
-
-                sock.set_proxy(
-                    proxy_type,
-                    proxy_info['address'],
-                    int(proxy_info['port']),
-                    username=proxy_info.get('username'),
-                    password=proxy_info.get('password')
-                )
-
-                sock.settimeout(5)  # Set connection timeout
-                sock.connect(("8.8.8.8", 53))  # Connect to Google DNS
-                sock.close()
-
-                self.logger.info("A proxy is working.")
-                return True
-            else:
+            if proxy_info['type'].lower() not in SUPPORTED_PROXY_TYPES:
                 self.logger.warning("Unsupported proxy type detected.")
                 return False
-        except Exception as e:
-            self.logger.warning(f"A proxy failed: {str(e)}")
+            session = self._create_proxy_session(proxy_info, retry=False)
+        except (KeyError, TypeError, AttributeError) as e:
+            self.logger.warning(f"A proxy failed: invalid proxy entry ({e!r})")
             return False
 
-    def _rotate_proxy(self):
+        try:
+            return self._test_session(session)
+        finally:
+            session.close()
+
+    def _test_session(self, session):
         """
-        Rotates to the next proxy in the list.
+        Tests if a session can reach the Binance API. The session should not retry,
+        otherwise a dead proxy takes several timeouts to be reported.
+
+        :param session: A `requests.Session` (usually configured with a proxy).
+        :return: True if the request succeeded, False otherwise.
         """
-        self.proxy_index = (self.proxy_index + 1) % len(self.proxy_list)
-        self.logger.info("Rotated to the next proxy.")
+        try:
+            # Same method as the direct probe, so both routes are judged alike
+            resp = session.get(PROXY_TEST_URL, timeout=PROXY_TEST_TIMEOUT)
+            if resp.ok:
+                self.logger.info("A proxy is working.")
+                return True
+            self.logger.warning(f"A proxy failed: HTTP {resp.status_code}")
+        except Exception as e:
+            self.logger.warning(f"A proxy failed: {str(e)}")
+        return False
 
-    def _set_proxy_for_session(self, proxy_info):
+    def _create_proxy_session(self, proxy_info, retry=True):
         """
-        Configures the current session with a proxy.
+        Creates a new session that routes its traffic through a proxy.
 
         :param proxy_info: Dictionary with proxy details.
+        :param retry: False => no retries (used for probing)
+        :return: A `requests.Session` configured with the proxy.
         """
         proxy_type = proxy_info['type'].lower()
         proxy_scheme = proxy_type
@@ -82,28 +94,120 @@ class ProxyManager:
             proxy['http'] = f"{proxy_scheme}://{proxy_info['username']}:{proxy_info['password']}@{proxy_info['address']}:{proxy_info['port']}"
             proxy['https'] = f"{proxy_scheme}://{proxy_info['username']}:{proxy_info['password']}@{proxy_info['address']}:{proxy_info['port']}"
 
-        self.session = requests.Session()
-        self.session.proxies.update(proxy)
+        session = self._create_session(retry)
+        session.proxies.update(proxy)
+        return session
+
+    @staticmethod
+    def _create_session(retry=True):
+        """
+        Creates a new session with a pooled HTTP adapter.
+
+        :param retry: True => retry idempotent requests on connection errors and 5xx,
+                      False => fail on the first error (used for probing)
+        :return: A `requests.Session`.
+        """
+        session = requests.Session()
+
+        # POST is left out of the retried methods so an order is never submitted twice.
+        # Requests are signed with a timestamp, so retries keep to the short backoff: a 429 is
+        # not retried (that risks a 418 ban) and Retry-After is ignored, as waiting it out would
+        # re-send the same signature past its recvWindow.
+        if retry:
+            max_retries = Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods={'GET', 'HEAD', 'DELETE'},
+                respect_retry_after_header=False
+            )
+        else:
+            max_retries = Retry(0, read=False)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=PROXY_POOL_MAXSIZE,
+            max_retries=max_retries
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _set_proxy_for_session(self, proxy_info):
+        """
+        Configures the current session with a proxy.
+
+        :param proxy_info: Dictionary with proxy details.
+        """
+        self.session = self._create_proxy_session(proxy_info)
         self.logger.info("Session configured with a proxy.")
 
-    def _get_session_with_working_proxy(self):
+    def _set_direct_session(self):
+        """
+        Configures the current session without a proxy.
+        """
+        self.session = self._create_session()
+        self.logger.info("Session configured with a direct connection.")
+
+    def _get_session_with_working_proxy(self, try_direct=False):
         """
-        Tries to create a session with a working proxy from the list.
+        Tests all proxies in parallel and keeps the first one that reaches the Binance API.
 
-        :return: A `requests.Session` with a working proxy or None.
+        :param try_direct: True => probe a direct connection alongside the proxies and prefer it
+                           when it answers within DIRECT_MAX_LATENCY (or no proxy works)
+        :return: A `requests.Session` with a working proxy (or direct connection) or None.
         """
-        for _ in range(len(self.proxy_list)):
-            proxy_info = self.proxy_list[self.proxy_index]
-            self.logger.info("Testing a proxy...")
+        if not self.proxy_list and not try_direct:
+            self.logger.error("No working proxy found.")
+            return None
 
-            if self._test_proxy(proxy_info):
-                self._set_proxy_for_session(proxy_info)
-                return self.session
+        if self.proxy_list:
+            self.logger.info(f"Testing {len(self.proxy_list)} proxies...")
+        executor = ThreadPoolExecutor(max_workers=min(16, len(self.proxy_list) + 1))
+        start = time.monotonic()
+        direct = executor.submit(self._test_direct) if try_direct else None
+        futures = {executor.submit(self._test_proxy, proxy_info): proxy_info for proxy_info in self.proxy_list}
 
-            self._rotate_proxy()
+        winner = None
+        use_direct = False
+        try:
+            for future in as_completed([direct, *futures] if direct else futures):
+                if future is direct:
+                    latency = future.result()
+                    if latency is not None and (latency < DIRECT_MAX_LATENCY or not self.proxy_list):
+                        use_direct = True
+                        break
+                elif future.result():
+                    winner = futures[future]
+                    break
 
-        self.logger.error("No working proxy found.")
-        return None
+            if direct and not use_direct:
+                if winner is None:
+                    # No proxy works, so any working direct connection will do
+                    use_direct = direct.result() is not None
+                else:
+                    # A proxy works, but a direct connection is still preferred if it is fast enough
+                    remaining = start + DIRECT_MAX_LATENCY - time.monotonic()
+                    try:
+                        latency = direct.result(timeout=max(remaining, 0))
+                    except FutureTimeoutError:
+                        latency = None
+                    use_direct = latency is not None and latency < DIRECT_MAX_LATENCY
+        finally:
+            # Probes still running close their own sessions when they finish
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if use_direct:
+            if winner is None and self.proxy_list:
+                self.logger.warning("No working proxy found. Falling back to the direct connection.")
+            self._set_direct_session()
+            return self.session
+
+        if winner is None:
+            self.logger.error("No working proxy found.")
+            return None
+
+        self._set_proxy_for_session(winner)
+        return self.session
 
     def test_current_proxy(self):
         """
@@ -112,9 +216,14 @@ class ProxyManager:
         :return: True if the proxy works, False otherwise.
         """
         if self.session:
-            proxy_info = self.proxy_list[self.proxy_index]
-            if self._test_proxy(proxy_info):
-                return True
+            # Probe through a retry-free session with the same proxies as the live one
+            probe = self._create_session(retry=False)
+            probe.proxies.update(self.session.proxies)
+            try:
+                if self._test_session(probe):
+                    return True
+            finally:
+                probe.close()
         else:
             self.logger.warning("No active session found. Selecting a proxy.")
 
@@ -136,11 +245,34 @@ class ProxyManager:
 
         return self.session
 
-    def initialize_session(self):
+    def _test_direct(self):
         """
-        Initializes a session with the first working proxy.
+        Tries to reach the Binance API without a proxy.
 
-        :return: A `requests.Session` or None if no proxy works.
+        :return: Latency in seconds, or None if unreachable.
+        """
+        session = self._create_session(retry=False)
+        try:
+            start = time.monotonic()
+            resp = session.get(PROXY_TEST_URL, timeout=2)
+            latency = time.monotonic() - start
+            if resp.ok:
+                return latency
+            self.logger.warning(f"Direct connection failed: HTTP {resp.status_code}")
+        except Exception as e:
+            self.logger.warning(f"Direct connection failed: {str(e)}")
+        finally:
+            session.close()
+        return None
+
+    def initialize_session(self, force_proxy=False):
+        """
+        Initializes the session. The direct connection and all proxies are probed in parallel;
+        a direct connection is used when Binance answers within DIRECT_MAX_LATENCY without a proxy
+        (or no proxy works), otherwise the first working proxy is used.
+
+        :param force_proxy: True => always route traffic through a proxy
+        :return: A `requests.Session` or None if neither a direct connection nor a proxy works.
         """
-        self.logger.info("Initializing session with a proxy.")
-        return self.get_working_session()
+        self.logger.info("Initializing session.")
+        return self._get_session_with_working_proxy(try_direct=not force_proxy)
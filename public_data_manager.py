@@ -3,19 +3,131 @@ Public Data Manager
 ---------------------
 This module provides functions for fetching public Binance data without requiring authentication, including:
 - Server status and time
-- Current spot prices for symbols
+- Current spot prices for one or several symbols
 - Extended kline (candlestick) data for Spot and Futures markets
 """
 
+import json
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-import datetime
+from utils import WeightLimiter
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Length of each fixed-size kline interval in milliseconds ('1M' varies and is fetched serially)
+KLINE_INTERVAL_MS = {
+    '1s': 1000, '1m': 60_000, '3m': 180_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '4h': 14_400_000, '6h': 21_600_000, '8h': 28_800_000,
+    '12h': 43_200_000, '1d': 86_400_000, '3d': 259_200_000, '1w': 604_800_000
+}
+
+# Kline endpoints with the full query prebuilt; filled with (symbol, interval, limit, endTime)
+SPOT_KLINES_URL = "https://api.binance.com/api/v3/klines?symbol=%s&interval=%s&limit=%d&endTime=%d"
+FUTURES_KLINES_URL = "https://fapi.binance.com/fapi/v1/klines?symbol=%s&interval=%s&limit=%d&endTime=%d"
+
+# (connect, read) timeout in seconds for every public data request
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Maximum number of kline chunks fetched in parallel, to stay well within Binance's weight limit
+MAX_KLINE_WORKERS = 6
+
+# Above this many symbols, get_symbol_prices_spot fetches the full ticker list instead
+MAX_PRICE_SYMBOLS = 20
+
+# Default number of seconds a fetched price or order book is reused by repeated calls
+DEFAULT_CACHE_TTL = 0.2
+
+# Request weight allowed per minute on the Spot and Futures hosts
+SPOT_WEIGHT_LIMIT = 6000
+FUTURES_WEIGHT_LIMIT = 2400
+
+
+def _klines_weight(limit: int, is_futures: bool) -> int:
+    """
+    Returns the request weight of a klines call with the given limit.
+    """
+    if not is_futures:
+        return 2
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def _depth_weight(limit: int, is_futures: bool) -> int:
+    """
+    Returns the request weight of an order book call with the given limit.
+    """
+    if is_futures:
+        if limit <= 50:
+            return 2
+        if limit <= 100:
+            return 5
+        if limit <= 500:
+            return 10
+        return 20
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    if limit <= 1000:
+        return 50
+    return 250
+
+
+def _copy_order_book(order_book: dict) -> dict:
+    """
+    Returns a copy of a cached order book whose `bids` and `asks` lists can be modified
+    (e.g. levels popped) without affecting the cache or other callers.
+    """
+    book = dict(order_book)
+    for side in ('bids', 'asks'):
+        if side in book:
+            book[side] = list(book[side])
+    return book
 
 
 class PublicDataManager:
-    @staticmethod
-    def ping() -> dict:
+    def __init__(self):
+        """
+        Initializes the PublicDataManager with one persistent, pooled session shared by
+        the Spot and Futures hosts, so consecutive calls reuse the same keep-alive
+        connections instead of paying a new TLS handshake each time.
+        """
+        self.logger = logging.getLogger(__name__)
+
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            # 418 (IP banned) is deliberately not retried: urllib3 ignores its Retry-After and
+            # every retry only extends the ban
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self._session.mount('https://', adapter)
+
+        # Short-lived caches so bursts of identical reads share one request
+        self._price_cache = {}
+        self._order_book_cache = {}
+
+        # Request weight budgets, shared by all threads fetching through this manager
+        self._spot_limiter = WeightLimiter(SPOT_WEIGHT_LIMIT)
+        self._fut_limiter = WeightLimiter(FUTURES_WEIGHT_LIMIT)
+
+    def ping(self) -> dict:
         """
         Simple ping to check Binance server status.
         
@@ -23,15 +135,14 @@ class PublicDataManager:
         """
         url = "https://api.binance.com/api/v3/ping"
         try:
-            resp = requests.get(url)
+            resp = self._session.get(url, timeout=REQUEST_TIMEOUT)
             if resp.ok:
-                return resp.json() if resp.text else {"status": "ok"}
+                return _loads(resp.content) if resp.content else {"status": "ok"}
         except Exception as e:
-            print(f"Exception in ping(): {e}")
+            self.logger.error("Exception in ping(): %s", e)
         return None
 
-    @staticmethod
-    def get_server_time() -> dict:
+    def get_server_time(self) -> dict:
         """
         Retrieves current Binance server time.
         
@@ -39,50 +150,114 @@ class PublicDataManager:
         """
         url = "https://api.binance.com/api/v3/time"
         try:
-            resp = requests.get(url)
+            resp = self._session.get(url, timeout=REQUEST_TIMEOUT)
             if resp.status_code == 200:
-                return resp.json()
+                return _loads(resp.content)
             else:
-                print(f"Error get_server_time: {resp.status_code}, {resp.content}")
+                self.logger.error("Error get_server_time: %s, %s", resp.status_code, resp.content)
         except Exception as e:
-            print(f"Exception in get_server_time(): {e}")
+            self.logger.error("Exception in get_server_time(): %s", e)
         return None
 
-    @staticmethod
-    def get_symbol_price_spot(symbol: str) -> float:
+    def get_symbol_price_spot(self, symbol: str, ttl: float = DEFAULT_CACHE_TTL) -> float:
         """
         Returns the current spot price for a symbol (e.g., BTCUSDT).
         
         :param symbol: The trading pair symbol.
+        :param ttl: Seconds a previously fetched price may be reused (0 disables caching).
         :return: Current spot price as a float, or None if an error occurs.
         """
-        url = f"https://api.binance.com/api/v3/ticker/price?symbol={symbol}"
+        if (entry := self._price_cache.get(symbol)) and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+
+        # A single-symbol request (weight 2) is cheaper than the symbols= form (weight 4)
+        url = "https://api.binance.com/api/v3/ticker/price"
         try:
-            resp = requests.get(url)
+            resp = self._session.get(url, params={'symbol': symbol}, timeout=REQUEST_TIMEOUT)
             if resp.status_code == 200:
-                data = resp.json()
-                return float(data['price'])
+                price = float(_loads(resp.content)['price'])
+                self._price_cache[symbol] = (time.monotonic(), price)
+                return price
             else:
-                print(f"Error get_symbol_price_spot: {resp.status_code}, {resp.content}")
+                self.logger.error("Error get_symbol_price_spot: %s, %s", resp.status_code, resp.content)
         except Exception as e:
-            print(f"Exception in get_symbol_price_spot: {e}")
+            self.logger.error("Exception in get_symbol_price_spot: %s", e)
         return None
 
-    def get_spot_klines_extended(self, symbol='BTCUSDT', interval='4h', limit=1500, current_time=None) -> pd.DataFrame:
+    def get_symbol_prices_spot(self, symbols: list = None) -> dict:
+        """
+        Returns the current spot prices for several symbols with a single request.
+
+        For no symbols or long lists, the full ticker list is fetched once and filtered locally.
+        Unknown symbols are left out of the result.
+
+        :param symbols: List of trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT']), or None for all symbols.
+        :return: Dictionary mapping each symbol to its price, or None if an error occurs.
+        """
+        if symbols is not None and not symbols:
+            return {}
+
+        url = "https://api.binance.com/api/v3/ticker/price"
+        fetch_all = symbols is None or len(symbols) > MAX_PRICE_SYMBOLS
+        params = None if fetch_all else {'symbols': json.dumps(symbols, separators=(',', ':'))}
+        try:
+            resp = self._session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+            if resp.status_code == 400 and not fetch_all:
+                # One unknown symbol fails the whole request; filter the full list like long lists are
+                fetch_all = True
+                resp = self._session.get(url, timeout=REQUEST_TIMEOUT)
+            if resp.status_code == 200:
+                prices = {d['symbol']: float(d['price']) for d in _loads(resp.content)}
+                if symbols is not None and fetch_all:
+                    prices = {symbol: prices[symbol] for symbol in symbols if symbol in prices}
+                return prices
+            else:
+                self.logger.error("Error get_symbol_prices_spot: %s, %s", resp.status_code, resp.content)
+        except Exception as e:
+            self.logger.error("Exception in get_symbol_prices_spot: %s", e)
+        return None
+
+    def get_spot_klines_extended(self, symbol='BTCUSDT', interval='4h', limit=1500, current_time=None,
+                                 start_time=None) -> pd.DataFrame:
         """
         Fetches extended kline data for Spot market.
+
+        For fixed-length intervals, `limit` covers the last `limit` intervals of time ending at
+        `current_time` (or now); if the market had gaps (maintenance, delistings), fewer than
+        `limit` bars are returned.
+
+        If `start_time` is given, all bars from `start_time` up to `current_time` (or now) are
+        fetched and `limit` is ignored.
         """
-        return self._fetch_klines_extended(symbol, interval, limit, current_time, is_futures=False)
+        return self._fetch_klines_extended(symbol, interval, limit, current_time, is_futures=False,
+                                           start_time=start_time)
 
-    def get_futures_klines_extended(self, symbol='BTCUSDT', interval='4h', limit=1500, current_time=None) -> pd.DataFrame:
+    def get_futures_klines_extended(self, symbol='BTCUSDT', interval='4h', limit=1500, current_time=None,
+                                    start_time=None) -> pd.DataFrame:
         """
         Fetches extended kline data for Futures market.
+
+        For fixed-length intervals, `limit` covers the last `limit` intervals of time ending at
+        `current_time` (or now); if the market had gaps (maintenance, delistings), fewer than
+        `limit` bars are returned.
+
+        If `start_time` is given, all bars from `start_time` up to `current_time` (or now) are
+        fetched and `limit` is ignored.
         """
-        return self._fetch_klines_extended(symbol, interval, limit, current_time, is_futures=True)
+        return self._fetch_klines_extended(symbol, interval, limit, current_time, is_futures=True,
+                                           start_time=start_time)
 
-    def _fetch_klines_extended(self, symbol, interval, limit=1500, current_time=None, is_futures=False) -> pd.DataFrame:
+    def _fetch_klines_extended(self, symbol, interval, limit=1500, current_time=None, is_futures=False,
+                               start_time=None) -> pd.DataFrame:
         """
-        Iteratively fetches large amounts of candlestick (kline) data.
+        Fetches large amounts of candlestick (kline) data in chunks of up to 1000 bars.
+
+        For fixed-length intervals the chunk windows are computed up front and fetched
+        concurrently; for calendar intervals ('1M') they are fetched one after another.
+        The fixed windows span `limit` intervals of time rather than `limit` bars, so periods
+        without trading yield fewer rows; '1M' chunks follow the returned bars, so there
+        `limit` still counts bars.
+        Failed requests are retried with backoff by the session (honoring Retry-After on 429).
         """
         columns = [
             'open_time', 'open', 'high', 'low', 'close', 'volume',
@@ -93,63 +268,137 @@ class PublicDataManager:
         if current_time:
             end_time = int(current_time.timestamp() * 1000)
         else:
-            end_time = int(datetime.datetime.now().timestamp() * 1000)
+            end_time = time.time_ns() // 1_000_000
 
-        df = pd.DataFrame()
+        url_template = FUTURES_KLINES_URL if is_futures else SPOT_KLINES_URL
+        interval_ms = KLINE_INTERVAL_MS.get(interval)
+        chunks = []
 
-        while limit > 0:
-            chunk_size = min(limit, 1000)
-            base_url = "https://fapi.binance.com" if is_futures else "https://api.binance.com"
-            url = (f"{base_url}/fapi/v1/klines?" if is_futures else f"{base_url}/api/v3/klines?")
-            url += f"symbol={symbol}&interval={interval}&limit={chunk_size}&endTime={end_time}"
+        start_ms = None
+        if start_time:
+            start_ms = int(start_time.timestamp() * 1000)
+            # Months are at least 28 days long, so this never undercounts; extra bars are trimmed below
+            bar_ms = interval_ms if interval_ms is not None else 28 * KLINE_INTERVAL_MS['1d']
+            limit = max(0, (end_time - start_ms) // bar_ms + 1)
 
-            try:
-                resp = requests.get(url)
-                if resp.status_code != 200:
-                    print(f"Error fetching klines chunk: Status={resp.status_code}, Content={resp.content}")
-                    break
+        if interval_ms is not None:
+            # Each window is bounded on both sides, so chunks never overlap even if the market had gaps
+            windows = []
+            while limit > 0:
+                chunk_size = min(limit, 1000)
+                window_start = end_time - chunk_size * interval_ms + 1
+                windows.append((chunk_size, end_time, window_start))
+                end_time = window_start - 1
+                limit -= chunk_size
 
-                chunk_data = resp.json()
+            if windows:
+                executor = ThreadPoolExecutor(max_workers=min(MAX_KLINE_WORKERS, len(windows)))
+                futures = [
+                    executor.submit(self._fetch_klines_chunk, url_template, symbol, interval,
+                                    chunk_size, window_end, is_futures, window_start)
+                    for chunk_size, window_end, window_start in windows
+                ]
+                try:
+                    # Stop at the first failed chunk so the result stays contiguous; empty windows are skipped.
+                    # Windows not yet started are cancelled, so a failure doesn't spend the rest of the weight.
+                    for future in futures:
+                        chunk_data = future.result()
+                        if chunk_data is None:
+                            break
+                        if chunk_data:
+                            chunks.append(chunk_data)
+                finally:
+                    executor.shutdown(cancel_futures=True)
+        else:
+            while limit > 0:
+                chunk_size = min(limit, 1000)
+                chunk_data = self._fetch_klines_chunk(url_template, symbol, interval, chunk_size, end_time, is_futures)
                 if not chunk_data:
                     break
+                chunks.append(chunk_data)
 
-                tmp_df = pd.DataFrame(chunk_data, columns=columns)
-                tmp_df['open_time'] = pd.to_datetime(tmp_df['open_time'], unit='ms')
-                tmp_df['close_time'] = pd.to_datetime(tmp_df['close_time'], unit='ms')
+                end_time = chunk_data[0][0] - 1
+                limit -= chunk_size
 
-                numeric_cols = columns[1:-1]
-                tmp_df[numeric_cols] = tmp_df[numeric_cols].apply(pd.to_numeric, errors='coerce')
+        # Build the DataFrame once from all rows instead of growing it chunk by chunk.
+        # Chunks arrive newest first and are each in ascending order, so reversing them yields sorted rows.
+        all_rows = []
+        for chunk_data in reversed(chunks):
+            all_rows.extend(chunk_data)
 
-                df = pd.concat([df, tmp_df], ignore_index=True)
+        arr = np.array(all_rows, dtype=object).reshape(-1, len(columns))
+        open_times_ms = arr[:, 0].astype(np.int64)
+        if start_ms is not None:
+            keep = open_times_ms >= start_ms
+            arr, open_times_ms = arr[keep], open_times_ms[keep]
 
-                first_open_time = tmp_df.iloc[0]['open_time']
-                end_time = int(first_open_time.value // 10**6 - 1)
+        # Binance sends prices and volumes as clean numeric strings, so each column is cast in one go
+        data = {}
+        for i, col in enumerate(columns):
+            if col == 'open_time':
+                data[col] = pd.to_datetime(open_times_ms, unit='ms')
+            elif col == 'close_time':
+                data[col] = pd.to_datetime(arr[:, i].astype(np.int64), unit='ms')
+            elif col == 'number_of_trades':
+                data[col] = arr[:, i].astype(np.int64)
+            elif col == 'ignore':
+                data[col] = arr[:, i]
+            else:
+                data[col] = arr[:, i].astype(np.float64)
 
-                limit -= chunk_size
-                if limit > 1000:
-                    time.sleep(1)
-            except Exception as e:
-                print(f"Error in _fetch_klines_extended: {e}")
-                break
+        # The columns are freshly allocated and typed, so pandas can take them without copying
+        df = pd.DataFrame(data, copy=False)
 
         df.set_index('open_time', inplace=True)
-        df.sort_index(inplace=True)
+        assert df.index.is_monotonic_increasing
         return df
-        
-    def get_spot_order_book(self, symbol: str, limit=100) -> dict:
+
+    def _fetch_klines_chunk(self, url_template, symbol, interval, chunk_size, end_time, is_futures=False,
+                            start_time=None) -> list:
+        """
+        Fetches a single chunk of klines ending at `end_time` (and starting at `start_time`, if given).
+
+        :param url_template: SPOT_KLINES_URL or FUTURES_KLINES_URL
+        :return: The raw kline rows, or None if an error occurs.
+        """
+        url = url_template % (symbol, interval, chunk_size, end_time)
+        if start_time is not None:
+            url += '&startTime=%d' % start_time
+        limiter = self._fut_limiter if is_futures else self._spot_limiter
+
+        try:
+            limiter.acquire(_klines_weight(chunk_size, is_futures))
+            resp = self._session.get(url, timeout=REQUEST_TIMEOUT)
+            limiter.update(int(resp.headers.get('X-MBX-USED-WEIGHT-1M', '0')))
+            if resp.status_code == 418:
+                self.logger.critical("IP banned by Binance, retry after %s s: %s",
+                                     resp.headers.get('Retry-After'), resp.content)
+                return None
+            if resp.status_code != 200:
+                self.logger.error("Error fetching klines chunk: Status=%s, Content=%s", resp.status_code, resp.content)
+                return None
+
+            return _loads(resp.content)
+        except Exception as e:
+            self.logger.error("Error in _fetch_klines_chunk: %s", e)
+            return None
+
+    def get_spot_order_book(self, symbol: str, limit=100, ttl=DEFAULT_CACHE_TTL) -> dict:
         """
         Retrieve the order book for a given symbol from the Spot market.
 
         Parameters:
             symbol (str): The trading symbol (e.g., 'BTCUSDT').
             limit (int): The number of orders to retrieve from the order book (default is 100).
+            ttl (float): Seconds a previously fetched order book may be reused (0 disables caching).
+                Each caller gets its own copy of the `bids`/`asks` lists.
 
         Returns:
             dict: The order book data if successful, None otherwise.
         """
-        return self._fetch_order_book(symbol=symbol, limit=limit, is_futures=False, testnet=False)
+        return self._fetch_order_book(symbol=symbol, limit=limit, is_futures=False, testnet=False, ttl=ttl)
 
-    def get_futures_order_book(self, symbol: str, limit=100, testnet=False) -> dict:
+    def get_futures_order_book(self, symbol: str, limit=100, testnet=False, ttl=DEFAULT_CACHE_TTL) -> dict:
         """
         Retrieve the order book for a given symbol from the Futures market.
 
@@ -157,13 +406,16 @@ class PublicDataManager:
             symbol (str): The trading symbol (e.g., 'BTCUSDT').
             limit (int): The number of orders to retrieve from the order book (default is 100).
             testnet (bool): Whether to use the testnet for Futures (default is False).
+            ttl (float): Seconds a previously fetched order book may be reused (0 disables caching).
+                Each caller gets its own copy of the `bids`/`asks` lists.
 
         Returns:
             dict: The order book data if successful, None otherwise.
         """
-        return self._fetch_order_book(symbol=symbol, limit=limit, is_futures=True, testnet=testnet)
+        return self._fetch_order_book(symbol=symbol, limit=limit, is_futures=True, testnet=testnet, ttl=ttl)
 
-    def _fetch_order_book(self, symbol: str, limit=100, is_futures=False, testnet=False) -> dict:
+    def _fetch_order_book(self, symbol: str, limit=100, is_futures=False, testnet=False,
+                          ttl=DEFAULT_CACHE_TTL) -> dict:
         """
         Fetches the order book for a given symbol from Spot or Futures market.
 
@@ -172,10 +424,16 @@ class PublicDataManager:
             limit (int): The number of orders to retrieve from the order book (default is 100).
             is_futures (bool): Whether the market is Futures or Spot.
             testnet (bool): Whether to use the testnet for Futures (default is False).
+            ttl (float): Seconds a previously fetched order book may be reused (0 disables caching).
+                Each caller gets its own copy of the `bids`/`asks` lists.
 
         Returns:
             dict: The order book data if successful, None otherwise.
         """
+        cache_key = (symbol, limit, is_futures, testnet)
+        if (entry := self._order_book_cache.get(cache_key)) and time.monotonic() - entry[0] < ttl:
+            return _copy_order_book(entry[1])
+
         try:
             # Set the base URL and endpoint
             if is_futures:
@@ -186,16 +444,21 @@ class PublicDataManager:
                 endpoint = '/api/v3/depth'
 
             # Make the API request
-            response = requests.get(base_url + endpoint, params={'symbol': symbol, 'limit': limit})
+            limiter = self._fut_limiter if is_futures else self._spot_limiter
+            limiter.acquire(_depth_weight(limit, is_futures))
+            response = self._session.get(base_url + endpoint, params={'symbol': symbol, 'limit': limit}, timeout=REQUEST_TIMEOUT)
+            limiter.update(int(response.headers.get('X-MBX-USED-WEIGHT-1M', '0')))
 
             # Handle the response
             if response.status_code == 200:
-                return response.json()
+                order_book = _loads(response.content)
+                self._order_book_cache[cache_key] = (time.monotonic(), order_book)
+                return _copy_order_book(order_book)
             else:
-                print(f'Error fetching order book. Status code: {response.status_code}')
-                print(f'Response content: {response.content}')
+                self.logger.error("Error fetching order book. Status code: %s, Response content: %s",
+                                  response.status_code, response.content)
                 return None
 
         except Exception as e:
-            print(f"Error fetching order book for symbol {symbol}. Exception: {e}")
+            self.logger.error("Error fetching order book for symbol %s. Exception: %s", symbol, e)
             return None
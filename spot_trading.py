@@ -8,9 +8,19 @@ This module provides functions for Binance Spot trading, including:
 """
 
 import logging
-import requests
 from utils import Utils
 
+# (connect, read) timeout in seconds for order placement and cancellation
+ORDER_TIMEOUT = (3.05, 5)
+
+# Order-type specific parameters sent with each spot order type
+_ORDER_PARAMS = {
+    'LIMIT': ('timeInForce', 'price', 'quantity'),
+    'LIMIT_MAKER': ('price', 'quantity'),
+    'MARKET': ('quantity',)
+}
+
+
 class SpotTrading:
     def __init__(self, api_key, api_secret, session, base_url_spot):
         """
@@ -25,8 +35,23 @@ class SpotTrading:
         self.api_secret = api_secret
         self.session = session
         self.base_url_spot = base_url_spot
+        self._headers = Utils.generate_headers(api_key)
         self.logger = logging.getLogger(__name__)
 
+    def _signed_query(self, params: dict) -> str:
+        """
+        Builds the signed query string for a request.
+
+        Binance Spot parameters are plain ASCII (symbols, enums, numbers), so the
+        query is joined directly instead of going through urlencode. Parameters
+        set to None are left out.
+
+        :param params: Insertion-ordered dictionary of request parameters.
+        :return:       The query string with its signature appended.
+        """
+        query = '&'.join(f'{key}={value}' for key, value in params.items() if value is not None)
+        return f'{query}&signature={Utils.sign_query(query.encode(), self.api_secret)}'
+
     def place_spot_order(self, symbol: str, side: str, order_type: str, quantity: str, 
                          price: str = None, time_in_force: str = "GTC") -> dict:
         """
@@ -52,17 +77,14 @@ class SpotTrading:
                 'timestamp': timestamp
             }
 
-            if order_type == 'LIMIT':
-                params.update({'timeInForce': time_in_force, 'price': price, 'quantity': quantity})
-            elif order_type == 'LIMIT_MAKER':
-                params.update({'price': price, 'quantity': quantity})
-            elif order_type == 'MARKET':
-                params['quantity'] = quantity
-
-            params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = {'X-MBX-APIKEY': self.api_key}
+            fields = _ORDER_PARAMS.get(order_type)
+            if fields is None:
+                raise ValueError(f"Unsupported spot order type: {order_type}")
+            values = {'timeInForce': time_in_force, 'price': price, 'quantity': quantity}
+            params.update((field, values[field]) for field in fields)
 
-            response = self.session.post(url, params=params, headers=headers)
+            response = self.session.post(f'{url}?{self._signed_query(params)}', headers=self._headers,
+                                         timeout=ORDER_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             self.logger.info(f"Spot order placed: {data}")
@@ -85,10 +107,8 @@ class SpotTrading:
             timestamp = Utils.get_current_timestamp_ms()
             params = {'symbol': symbol, 'orderId': order_id, 'timestamp': timestamp}
 
-            params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = {'X-MBX-APIKEY': self.api_key}
-
-            response = self.session.delete(url, params=params, headers=headers)
+            response = self.session.delete(f'{url}?{self._signed_query(params)}', headers=self._headers,
+                                           timeout=ORDER_TIMEOUT)
             response.raise_for_status()
             data = response.json()
             self.logger.info(f"Spot order canceled: {data}")
@@ -97,11 +117,13 @@ class SpotTrading:
             self.logger.error(f"Error canceling spot order ({order_id}) for {symbol}: {e}")
             return {}
 
-    def cancel_all_spot_orders(self, symbol: str) -> dict:
+    def cancel_all_spot_orders(self, symbol: str, per_order: bool = False) -> dict:
         """
         Cancels all open spot orders for a given symbol.
 
-        :param symbol: Trading pair (e.g. 'BTCUSDT')
+        :param symbol:    Trading pair (e.g. 'BTCUSDT')
+        :param per_order: True => cancel orders one by one (one request per order)
+                          False => cancel them all with a single DELETE /api/v3/openOrders
         :return: List of canceled orders
         """
         try:
@@ -110,18 +132,26 @@ class SpotTrading:
             timestamp = Utils.get_current_timestamp_ms()
             params = {'symbol': symbol, 'timestamp': timestamp}
 
-            params['signature'] = Utils.generate_signature(params, self.api_secret)
-            headers = {'X-MBX-APIKEY': self.api_key}
-
-            response = self.session.get(url, params=params, headers=headers)
+            response = self.session.get(f'{url}?{self._signed_query(params)}', headers=self._headers)
             response.raise_for_status()
             open_orders = response.json()
 
-            for order in open_orders:
-                self.cancel_spot_order(symbol, order['orderId'])
+            if not open_orders:
+                self.logger.info(f"No open spot orders for {symbol}.")
+                return {"cancelled_orders": []}
+
+            if per_order:
+                for order in open_orders:
+                    self.cancel_spot_order(symbol, order['orderId'])
+                cancelled_orders = open_orders
+            else:
+                params = {'symbol': symbol, 'timestamp': Utils.get_current_timestamp_ms()}
+                response = self.session.delete(f'{url}?{self._signed_query(params)}', headers=self._headers)
+                response.raise_for_status()
+                cancelled_orders = response.json()
 
             self.logger.info(f"All open spot orders for {symbol} canceled.")
-            return {"cancelled_orders": open_orders}
+            return {"cancelled_orders": cancelled_orders}
         except Exception as e:
             self.logger.error(f"Error canceling all spot orders for {symbol}: {e}")
             return {}
@@ -6,14 +6,29 @@ including:
 - Generating API request signatures
 - Fetching the current Unix timestamp in milliseconds
 - Creating request headers with the API key
+- Tracking the per-minute request weight budget (WeightLimiter)
 """
 
+import threading
 import time
+from functools import lru_cache
 from hashlib import sha256
 from urllib.parse import urlencode
 import hmac
 
 
+# Note: the cache is process-wide, so the keyed HMAC state of (and the reference to) every
+# secret used with it stays in memory for the lifetime of the process, up to 8 secrets.
+@lru_cache(maxsize=8)
+def _hmac_template(api_secret: str):
+    """
+    Returns an HMAC-SHA256 object keyed with `api_secret`, to be copied for each signature.
+
+    Keying is done once per secret, so each signature only copies the prepared state.
+    """
+    return hmac.new(api_secret.encode('utf-8'), digestmod=sha256)
+
+
 class Utils:
     @staticmethod
     def get_current_timestamp_ms() -> int:
@@ -22,7 +37,7 @@ class Utils:
 
         :return: The current timestamp in milliseconds.
         """
-        return int(time.time() * 1000)
+        return time.time_ns() // 1_000_000
 
     @staticmethod
     def generate_signature(params: dict, api_secret: str) -> str:
@@ -33,8 +48,20 @@ class Utils:
         :param api_secret:  Your Binance API secret key.
         :return:            HMAC-SHA256 signature as a string.
         """
-        query_string = urlencode(params)
-        return hmac.new(api_secret.encode('utf-8'), query_string.encode('utf-8'), sha256).hexdigest()
+        return Utils.sign_query(urlencode(params).encode('utf-8'), api_secret)
+
+    @staticmethod
+    def sign_query(query: bytes, api_secret: str) -> str:
+        """
+        Signs an already composed query string for Binance API requests.
+
+        :param query:       The query string to sign, as bytes.
+        :param api_secret:  Your Binance API secret key.
+        :return:            HMAC-SHA256 signature as a string.
+        """
+        h = _hmac_template(api_secret).copy()
+        h.update(query)
+        return h.hexdigest()
 
     @staticmethod
     def generate_headers(api_key: str) -> dict:
@@ -45,3 +72,57 @@ class Utils:
         :return:        A dictionary containing the headers.
         """
         return {'X-MBX-APIKEY': api_key}
+
+
+class WeightLimiter:
+    def __init__(self, limit_per_minute: int):
+        """
+        Tracks Binance's per-minute request weight budget for one host.
+
+        Callers reserve the weight of a request before sending it and report the
+        X-MBX-USED-WEIGHT-1M header afterwards, so the local count stays in sync
+        with Binance (including weight used by other clients on the same IP).
+
+        :param limit_per_minute: The request weight allowed per minute.
+        """
+        self.limit = limit_per_minute
+        self.used = 0
+        self.reset_at = self._next_minute()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _next_minute() -> float:
+        """
+        Returns the Unix time of the next minute boundary, when Binance resets the weight count.
+        """
+        return (time.time() // 60 + 1) * 60
+
+    def acquire(self, weight: int = 1):
+        """
+        Reserves `weight` from the budget, sleeping until the next minute if it is exhausted.
+
+        :param weight: The weight of the request about to be sent.
+        """
+        while True:
+            with self._lock:
+                now = time.time()
+                if now >= self.reset_at:
+                    self.used = 0
+                    self.reset_at = self._next_minute()
+
+                if self.used + weight <= self.limit:
+                    self.used += weight
+                    return
+                wait = self.reset_at - now
+
+            time.sleep(wait)
+
+    def update(self, used_weight: int):
+        """
+        Resyncs the budget with the weight Binance reports as used in the current minute.
+
+        :param used_weight: Value of the X-MBX-USED-WEIGHT-1M response header.
+        """
+        with self._lock:
+            if time.time() < self.reset_at:
+                self.used = max(self.used, used_weight)